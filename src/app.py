@@ -8,6 +8,7 @@ for extracurricular activities at Mergington High School.
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
+from pydantic import BaseModel
 import os
 from pathlib import Path
 
@@ -81,6 +82,11 @@ activities = {
 }
 
 
+class BatchSignupRequest(BaseModel):
+    email: str
+    activities: list[str]
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
@@ -91,9 +97,8 @@ def get_activities():
     return activities
 
 
-@app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
-    """Sign up a student for an activity"""
+def add_participant(activity_name: str, email: str):
+    """Validate and add a student to an activity's participants"""
     # Validate activity exists
     if activity_name not in activities:
         raise HTTPException(status_code=404, detail="Activity not found")
@@ -107,9 +112,29 @@ def signup_for_activity(activity_name: str, email: str):
 
     # Add student
     activity["participants"].append(email)
+
+
+@app.post("/activities/{activity_name}/signup")
+def signup_for_activity(activity_name: str, email: str):
+    """Sign up a student for an activity"""
+    add_participant(activity_name, email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
+@app.post("/activities/batch-signup")
+def batch_signup_for_activities(batch: BatchSignupRequest):
+    """Sign up a student for several activities, reporting the outcome of each"""
+    results = []
+    for activity_name in batch.activities:
+        try:
+            add_participant(activity_name, batch.email)
+        except HTTPException as exc:
+            results.append({"activity": activity_name, "status": "error", "detail": exc.detail})
+        else:
+            results.append({"activity": activity_name, "status": "signed_up"})
+    return {"results": results}
+
+
 @app.delete("/activities/{activity_name}/unregister")
 def unregister_from_activity(activity_name: str, email: str):
     """Unregister a student from an activity"""
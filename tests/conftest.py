@@ -1,27 +1,37 @@
 """
 Test configuration and fixtures for FastAPI application
 """
+import asyncio
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from src.app import app, activities
-import copy
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI application"""
-    return TestClient(app)
+    """Create a test client shared across the whole test session"""
+    with TestClient(app) as c:
+        yield c
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def async_client():
+    """Create an async client for issuing concurrent requests to the application"""
+    c = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+    yield c
+    asyncio.run(c.aclose())
+
+
+@pytest.fixture(scope="function")
 def reset_activities():
-    """Reset activities to original state after each test"""
-    # Save original state
-    original_activities = copy.deepcopy(activities)
+    """Reset activity participants to their original state after each test"""
+    # Snapshot only the participant lists, the only state tests mutate
+    snapshots = {name: activity["participants"][:] for name, activity in activities.items()}
     yield
-    # Restore original state
-    activities.clear()
-    activities.update(original_activities)
+    # Restore original participants
+    for name, participants in snapshots.items():
+        activities[name]["participants"] = list(participants)
 
 
 @pytest.fixture
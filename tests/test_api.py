@@ -1,9 +1,44 @@
 """
 Tests for the FastAPI application endpoints
 """
+import asyncio
+from urllib.parse import quote
 import pytest
 from src.app import activities
 
+# Activity names and request paths, built once at import time; emails are
+# passed as query params
+CHESS_CLUB = "Chess Club"
+SOCCER_TEAM = "Soccer Team"
+PROGRAMMING_CLASS = "Programming Class"
+BASKETBALL_CLUB = "Basketball Club"
+ART_WORKSHOP = "Art Workshop"
+DRAMA_CLUB = "Drama Club"
+SCIENCE_CLUB = "Science Club"
+MATHLETES = "Mathletes"
+NONEXISTENT_ACTIVITY = "Nonexistent Activity"
+
+CHESS_SIGNUP = f"/activities/{CHESS_CLUB}/signup"
+SOCCER_SIGNUP = f"/activities/{SOCCER_TEAM}/signup"
+ENCODED_PROGRAMMING_SIGNUP = f"/activities/{quote(PROGRAMMING_CLASS)}/signup"
+BASKETBALL_UNREGISTER = f"/activities/{BASKETBALL_CLUB}/unregister"
+ART_UNREGISTER = f"/activities/{ART_WORKSHOP}/unregister"
+ENCODED_DRAMA_UNREGISTER = f"/activities/{quote(DRAMA_CLUB)}/unregister"
+SCIENCE_SIGNUP = f"/activities/{SCIENCE_CLUB}/signup"
+SCIENCE_UNREGISTER = f"/activities/{SCIENCE_CLUB}/unregister"
+MATHLETES_SIGNUP = f"/activities/{MATHLETES}/signup"
+NONEXISTENT_SIGNUP = f"/activities/{NONEXISTENT_ACTIVITY}/signup"
+NONEXISTENT_UNREGISTER = f"/activities/{NONEXISTENT_ACTIVITY}/unregister"
+BATCH_SIGNUP = "/activities/batch-signup"
+
+
+def assert_signed_up(client, email, *activity_names):
+    """Assert a student is registered both in memory and via the /activities endpoint"""
+    activities_data = client.get("/activities").json()
+    for activity_name in activity_names:
+        assert email in activities[activity_name]["participants"]
+        assert email in activities_data[activity_name]["participants"]
+
 
 class TestRootEndpoint:
     """Tests for the root endpoint"""
@@ -41,139 +76,89 @@ class TestActivitiesEndpoint:
         data = response.json()
         
         # Test a specific activity structure
-        chess_club = data.get("Chess Club")
+        chess_club = data.get(CHESS_CLUB)
         assert chess_club is not None
         assert chess_club["description"] == "Learn strategies and compete in chess tournaments"
         assert chess_club["max_participants"] == 12
         assert isinstance(chess_club["participants"], list)
 
 
-class TestSignupEndpoint:
-    """Tests for the signup endpoint"""
+class TestSignupAndUnregisterEndpoints:
+    """Tests for the signup and unregister endpoints, driven concurrently"""
     
-    def test_signup_success(self, client, reset_activities):
-        """Test successful signup for an activity"""
-        activity_name = "Chess Club"
-        email = "newstudent@mergington.edu"
-        
-        # Ensure student is not already registered
-        assert email not in activities[activity_name]["participants"]
-        
-        response = client.post(f"/activities/{activity_name}/signup?email={email}")
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert "message" in data
-        assert email in data["message"]
-        assert activity_name in data["message"]
-        
-        # Verify student is now in participants list
-        assert email in activities[activity_name]["participants"]
+    # (method, path, activity name, email, expected status, registered afterwards, detail)
+    # Each mutating scenario touches a distinct activity so they can run in any order
+    SCENARIOS = [
+        ("post", CHESS_SIGNUP, CHESS_CLUB,
+         "newstudent@mergington.edu", 200, True, None),
+        ("post", SOCCER_SIGNUP, SOCCER_TEAM,
+         "alex@mergington.edu", 400, True, "already signed up"),
+        ("post", NONEXISTENT_SIGNUP, None,
+         "student@mergington.edu", 404, None, "activity not found"),
+        ("post", ENCODED_PROGRAMMING_SIGNUP, PROGRAMMING_CLASS,
+         "newcoder@mergington.edu", 200, True, None),
+        ("delete", BASKETBALL_UNREGISTER, BASKETBALL_CLUB,
+         "mia@mergington.edu", 200, False, None),
+        ("delete", ART_UNREGISTER, ART_WORKSHOP,
+         "notregistered@mergington.edu", 400, False, "not registered"),
+        ("delete", NONEXISTENT_UNREGISTER, None,
+         "student@mergington.edu", 404, None, "activity not found"),
+        ("delete", ENCODED_DRAMA_UNREGISTER, DRAMA_CLUB,
+         "ella@mergington.edu", 200, False, None),
+    ]
     
-    def test_signup_duplicate_registration(self, client, reset_activities):
-        """Test signup when student is already registered"""
-        activity_name = "Chess Club"
-        email = "michael@mergington.edu"  # Already registered
-        
-        response = client.post(f"/activities/{activity_name}/signup?email={email}")
-        assert response.status_code == 400
-        
-        data = response.json()
-        assert "detail" in data
-        assert "already signed up" in data["detail"].lower()
+    @pytest.mark.asyncio
+    async def test_scenarios(self, async_client, reset_activities):
+        """Test success, duplicate, not-found and URL-encoded scenarios concurrently"""
+        # Verify students start in the opposite state for successful changes
+        for _, _, activity_name, email, status, registered, _ in self.SCENARIOS:
+            if status == 200:
+                assert (email in activities[activity_name]["participants"]) != registered
     
-    def test_signup_nonexistent_activity(self, client, reset_activities):
-        """Test signup for non-existent activity"""
-        activity_name = "Nonexistent Activity"
-        email = "student@mergington.edu"
-        
-        response = client.post(f"/activities/{activity_name}/signup?email={email}")
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert "detail" in data
-        assert "Activity not found" in data["detail"]
+        responses = await asyncio.gather(*(
+            async_client.request(method, path, params={"email": email})
+            for method, path, _, email, _, _, _ in self.SCENARIOS
+        ))
     
-    def test_signup_url_encoded_activity_name(self, client, reset_activities):
-        """Test signup with URL-encoded activity name"""
-        activity_name = "Programming Class"
-        email = "newcoder@mergington.edu"
-        
-        # URL encode the activity name
-        encoded_name = "Programming%20Class"
-        
-        response = client.post(f"/activities/{encoded_name}/signup?email={email}")
-        assert response.status_code == 200
-        
-        # Verify student is registered
-        assert email in activities[activity_name]["participants"]
+        for scenario, response in zip(self.SCENARIOS, responses):
+            method, path, activity_name, email, status, registered, detail = scenario
+            assert response.status_code == status, f"{method.upper()} {path}"
+    
+            data = response.json()
+            if status == 200:
+                assert email in data["message"]
+                assert activity_name in data["message"]
+            else:
+                assert detail in data["detail"].lower()
+    
+            # Verify registration state afterwards
+            if registered is not None:
+                assert (email in activities[activity_name]["participants"]) == registered
 
 
-class TestUnregisterEndpoint:
-    """Tests for the unregister endpoint"""
+class TestBatchSignupEndpoint:
+    """Tests for the batch signup endpoint"""
     
-    def test_unregister_success(self, client, reset_activities):
-        """Test successful unregistration from an activity"""
-        activity_name = "Chess Club"
-        email = "michael@mergington.edu"  # Already registered
-        
-        # Verify student is currently registered
-        assert email in activities[activity_name]["participants"]
-        
-        response = client.delete(f"/activities/{activity_name}/unregister?email={email}")
+    def test_batch_signup_partial_failure(self, client, reset_activities):
+        """Test that failed items are reported without blocking the others"""
+        email = "michael@mergington.edu"  # Already in Chess Club
+        
+        response = client.post(BATCH_SIGNUP, json={
+            "email": email,
+            "activities": [CHESS_CLUB, NONEXISTENT_ACTIVITY, DRAMA_CLUB],
+        })
         assert response.status_code == 200
         
-        data = response.json()
-        assert "message" in data
-        assert email in data["message"]
-        assert activity_name in data["message"]
-        
-        # Verify student is no longer in participants list
-        assert email not in activities[activity_name]["participants"]
-    
-    def test_unregister_not_registered(self, client, reset_activities):
-        """Test unregister when student is not registered"""
-        activity_name = "Chess Club"
-        email = "notregistered@mergington.edu"
+        results = response.json()["results"]
+        assert results[0]["status"] == "error"
+        assert "already signed up" in results[0]["detail"].lower()
+        assert results[1]["status"] == "error"
+        assert "Activity not found" in results[1]["detail"]
+        assert results[2]["status"] == "signed_up"
         
-        # Ensure student is not registered
-        assert email not in activities[activity_name]["participants"]
-        
-        response = client.delete(f"/activities/{activity_name}/unregister?email={email}")
-        assert response.status_code == 400
-        
-        data = response.json()
-        assert "detail" in data
-        assert "not registered" in data["detail"].lower()
-    
-    def test_unregister_nonexistent_activity(self, client, reset_activities):
-        """Test unregister from non-existent activity"""
-        activity_name = "Nonexistent Activity"
-        email = "student@mergington.edu"
-        
-        response = client.delete(f"/activities/{activity_name}/unregister?email={email}")
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert "detail" in data
-        assert "Activity not found" in data["detail"]
-    
-    def test_unregister_url_encoded_activity_name(self, client, reset_activities):
-        """Test unregister with URL-encoded activity name"""
-        activity_name = "Programming Class"
-        email = "emma@mergington.edu"  # Already registered
-        
-        # Verify student is currently registered
-        assert email in activities[activity_name]["participants"]
-        
-        # URL encode the activity name
-        encoded_name = "Programming%20Class"
-        
-        response = client.delete(f"/activities/{encoded_name}/unregister?email={email}")
-        assert response.status_code == 200
-        
-        # Verify student is no longer registered
-        assert email not in activities[activity_name]["participants"]
+        # Verify only the successful signup was applied
+        assert activities[CHESS_CLUB]["participants"].count(email) == 1
+        assert email in activities[DRAMA_CLUB]["participants"]
 
 
 class TestIntegrationScenarios:
@@ -181,68 +166,58 @@ class TestIntegrationScenarios:
     
     def test_signup_and_unregister_workflow(self, client, reset_activities):
         """Test complete signup and unregister workflow"""
-        activity_name = "Science Club"
+        activity_name = SCIENCE_CLUB
         email = "workflow@mergington.edu"
         
         # Step 1: Verify initial state
-        initial_participants = activities[activity_name]["participants"].copy()
-        assert email not in initial_participants
+        assert email not in activities[activity_name]["participants"]
         
         # Step 2: Sign up
-        signup_response = client.post(f"/activities/{activity_name}/signup?email={email}")
+        signup_response = client.post(SCIENCE_SIGNUP, params={"email": email})
         assert signup_response.status_code == 200
         assert email in activities[activity_name]["participants"]
         
-        # Step 3: Verify signup reflected in activities endpoint
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity_name]["participants"]
-        
-        # Step 4: Unregister
-        unregister_response = client.delete(f"/activities/{activity_name}/unregister?email={email}")
+        # Step 3: Unregister
+        unregister_response = client.delete(SCIENCE_UNREGISTER, params={"email": email})
         assert unregister_response.status_code == 200
         assert email not in activities[activity_name]["participants"]
         
-        # Step 5: Verify unregistration reflected in activities endpoint
+        # Step 4: Verify unregistration reflected in activities endpoint
         activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity_name]["participants"]
+        assert email not in activities_response.json()[activity_name]["participants"]
     
     def test_multiple_signups_different_activities(self, client, reset_activities):
         """Test student signing up for multiple activities"""
         email = "multisport@mergington.edu"
-        activities_to_join = ["Chess Club", "Programming Class", "Science Club"]
+        activities_to_join = [CHESS_CLUB, PROGRAMMING_CLASS, SCIENCE_CLUB]
         
-        for activity_name in activities_to_join:
-            response = client.post(f"/activities/{activity_name}/signup?email={email}")
-            assert response.status_code == 200
-            assert email in activities[activity_name]["participants"]
+        response = client.post(BATCH_SIGNUP,
+                               json={"email": email, "activities": activities_to_join})
+        assert response.status_code == 200
         
-        # Verify student is in all activities
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
+        results = response.json()["results"]
+        assert [result["activity"] for result in results] == activities_to_join
+        for result in results:
+            assert result["status"] == "signed_up"
         
-        for activity_name in activities_to_join:
-            assert email in activities_data[activity_name]["participants"]
+        # Verify student is in all activities
+        assert_signed_up(client, email, *activities_to_join)
     
     def test_activity_capacity_tracking(self, client, reset_activities):
         """Test that participant counts are tracked correctly"""
-        activity_name = "Mathletes"  # Has max_participants: 10
+        activity_name = MATHLETES  # Has max_participants: 10
         
         # Get initial state
-        activities_response = client.get("/activities")
-        initial_data = activities_response.json()
-        initial_count = len(initial_data[activity_name]["participants"])
-        max_participants = initial_data[activity_name]["max_participants"]
+        initial_count = len(activities[activity_name]["participants"])
+        max_participants = activities[activity_name]["max_participants"]
         
         # Add a new participant
         new_email = "mathwhiz@mergington.edu"
-        signup_response = client.post(f"/activities/{activity_name}/signup?email={new_email}")
+        signup_response = client.post(MATHLETES_SIGNUP, params={"email": new_email})
         assert signup_response.status_code == 200
         
         # Verify count increased
         activities_response = client.get("/activities")
-        updated_data = activities_response.json()
-        new_count = len(updated_data[activity_name]["participants"])
+        new_count = len(activities_response.json()[activity_name]["participants"])
         assert new_count == initial_count + 1
-        assert new_count <= max_participants
\ No newline at end of file
+        assert new_count <= max_participants